@@ -1,5 +1,6 @@
 from .file_ops import FileOperations
 from .dir_ops import DirectoryOperations
 from .file_info import FileInfos
+from .async_ops import AsyncFileOperations
 
 __all__ = ["FileOps", "DirOps", "FileInfos"]
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Async File Operations Module
+Asynchronous mirror of the core file operations
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import List, Optional, Union
+
+from .file_ops import FileOperations
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFileOperations:
+    """Async mirror of FileOperations
+
+    Each method forwards to its synchronous counterpart via
+    asyncio.to_thread, so one event loop can keep many file operations
+    in flight -- the interpreter releases the GIL around the actual
+    I/O, and callers never block the loop. The method names, arguments
+    and return values match FileOperations exactly.
+    """
+
+    @staticmethod
+    async def create_file(filepath: Union[str, Path], content: str = "") -> bool:
+        return await asyncio.to_thread(
+            FileOperations.create_file, filepath, content)
+
+    @staticmethod
+    async def read_file(filepath: Union[str, Path],
+                        binary: bool = False) -> Optional[Union[str, bytes]]:
+        return await asyncio.to_thread(
+            FileOperations.read_file, filepath, binary)
+
+    @staticmethod
+    async def read_lines(filepath: Union[str, Path],
+                         binary: bool = False) -> Optional[Union[List[str], List[bytes]]]:
+        return await asyncio.to_thread(
+            FileOperations.read_lines, filepath, binary)
+
+    @staticmethod
+    async def batch_read(filepaths: List[Union[str, Path]],
+                         binary: bool = False) -> List[Optional[Union[str, bytes]]]:
+        # batch_read already fans out over its own thread pool; one
+        # to_thread hop keeps that fan-out off the event loop
+        return await asyncio.to_thread(
+            FileOperations.batch_read, filepaths, binary)
+
+    @staticmethod
+    async def update_file(filepath: Union[str, Path], content: str,
+                          append: bool = False) -> bool:
+        return await asyncio.to_thread(
+            FileOperations.update_file, filepath, content, append)
+
+    @staticmethod
+    async def delete_file(filepath: Union[str, Path]) -> bool:
+        return await asyncio.to_thread(FileOperations.delete_file, filepath)
+
+    @staticmethod
+    async def copy_file(source: Union[str, Path],
+                        destination: Union[str, Path]) -> bool:
+        return await asyncio.to_thread(
+            FileOperations.copy_file, source, destination)
+
+    @staticmethod
+    async def move_file(source: Union[str, Path],
+                        destination: Union[str, Path]) -> bool:
+        return await asyncio.to_thread(
+            FileOperations.move_file, source, destination)
+
+    @staticmethod
+    async def rename_file(filepath: Union[str, Path], new_name: str) -> bool:
+        return await asyncio.to_thread(
+            FileOperations.rename_file, filepath, new_name)
@@ -9,6 +9,8 @@ import logging
 from pathlib import Path
 from typing import List, Union, Optional
 
+from .file_ops import _fast_copy
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,10 +32,10 @@ class DirectoryOperations:
         try:
             dirpath = Path(dirpath)
             dirpath.mkdir(parents=parents, exist_ok=True)
-            logger.info(f"Directory created: {dirpath}")
+            logger.info("Directory created: %s", dirpath)
             return True
         except Exception as e:
-            logger.error(f"Error creating directory {dirpath}: {e}")
+            logger.error("Error creating directory %s: %s", dirpath, e)
             return False
     
     @staticmethod
@@ -56,32 +58,41 @@ class DirectoryOperations:
         try:
             dirpath = Path(dirpath)
             if not dirpath.exists():
-                logger.error(f"Directory not found: {dirpath}")
+                logger.error("Directory not found: %s", dirpath)
                 return None
             
             if not dirpath.is_dir():
-                logger.error(f"Not a directory: {dirpath}")
+                logger.error("Not a directory: %s", dirpath)
                 return None
             
-            items = list(dirpath.iterdir())
-            
-            # Filter hidden files
-            if not show_hidden:
-                items = [item for item in items if not item.name.startswith('.')]
-            
-            # Filter by type
-            if files_only:
-                items = [item for item in items if item.is_file()]
-            elif dirs_only:
-                items = [item for item in items if item.is_dir()]
-            
+            # os.scandir answers is_file/is_dir from the directory read
+            # itself, avoiding one stat() per entry; decorate each entry
+            # with its sort key while it is in hand so sorting needs no
+            # further syscalls
+            entries = []
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    # Filter hidden files
+                    if not show_hidden and entry.name.startswith('.'):
+                        continue
+
+                    # Filter by type
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if files_only and not entry.is_file(follow_symlinks=False):
+                        continue
+                    if dirs_only and not is_dir:
+                        continue
+
+                    entries.append((not is_dir, entry.name.lower(), entry.path))
+
             # Sort: directories first, then files, alphabetically
-            items.sort(key=lambda x: (not x.is_dir(), x.name.lower()))
+            entries.sort()
+            items = [Path(path) for _, _, path in entries]
             
-            logger.debug(f"Listed directory: {dirpath} ({len(items)} items)")
+            logger.debug("Listed directory: %s (%s items)", dirpath, len(items))
             return items
         except Exception as e:
-            logger.error(f"Error listing directory {dirpath}: {e}")
+            logger.error("Error listing directory %s: %s", dirpath, e)
             return None
     
     @staticmethod
@@ -99,11 +110,11 @@ class DirectoryOperations:
         try:
             dirpath = Path(dirpath)
             if not dirpath.exists():
-                logger.error(f"Directory not found: {dirpath}")
+                logger.error("Directory not found: %s", dirpath)
                 return False
             
             if not dirpath.is_dir():
-                logger.error(f"Not a directory: {dirpath}")
+                logger.error("Not a directory: %s", dirpath)
                 return False
             
             if recursive:
@@ -111,10 +122,10 @@ class DirectoryOperations:
             else:
                 dirpath.rmdir()
             
-            logger.info(f"Directory deleted: {dirpath}")
+            logger.info("Directory deleted: %s", dirpath)
             return True
         except Exception as e:
-            logger.error(f"Error deleting directory {dirpath}: {e}")
+            logger.error("Error deleting directory %s: %s", dirpath, e)
             return False
     
     @staticmethod
@@ -134,18 +145,20 @@ class DirectoryOperations:
             destination = Path(destination)
             
             if not source.exists():
-                logger.error(f"Source directory not found: {source}")
+                logger.error("Source directory not found: %s", source)
                 return False
             
             if not source.is_dir():
-                logger.error(f"Source is not a directory: {source}")
+                logger.error("Source is not a directory: %s", source)
                 return False
             
-            shutil.copytree(source, destination, dirs_exist_ok=True)
-            logger.info(f"Directory copied: {source} -> {destination}")
+            # Per-file leaves go through the copy_file_range fast path
+            shutil.copytree(source, destination, dirs_exist_ok=True,
+                            copy_function=_fast_copy)
+            logger.info("Directory copied: %s -> %s", source, destination)
             return True
         except Exception as e:
-            logger.error(f"Error copying directory {source} to {destination}: {e}")
+            logger.error("Error copying directory %s to %s: %s", source, destination, e)
             return False
     
     @staticmethod
@@ -165,18 +178,18 @@ class DirectoryOperations:
             destination = Path(destination)
             
             if not source.exists():
-                logger.error(f"Source directory not found: {source}")
+                logger.error("Source directory not found: %s", source)
                 return False
             
             if not source.is_dir():
-                logger.error(f"Source is not a directory: {source}")
+                logger.error("Source is not a directory: %s", source)
                 return False
             
             shutil.move(str(source), str(destination))
-            logger.info(f"Directory moved: {source} -> {destination}")
+            logger.info("Directory moved: %s -> %s", source, destination)
             return True
         except Exception as e:
-            logger.error(f"Error moving directory {source} to {destination}: {e}")
+            logger.error("Error moving directory %s to %s: %s", source, destination, e)
             return False
     
     @staticmethod
@@ -193,19 +206,26 @@ class DirectoryOperations:
         try:
             dirpath = Path(dirpath)
             if not dirpath.exists() or not dirpath.is_dir():
-                logger.error(f"Invalid directory: {dirpath}")
+                logger.error("Invalid directory: %s", dirpath)
                 return None
             
-            total_size = sum(
-                f.stat().st_size 
-                for f in dirpath.rglob('*') 
-                if f.is_file()
-            )
+            # Recursive scandir walk: DirEntry.is_dir/stat are served from
+            # the directory read where possible, halving the stat syscalls
+            # of an rglob walk and skipping the per-entry Path allocations
+            def _walk_sizes(p):
+                with os.scandir(p) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            yield from _walk_sizes(entry.path)
+                        else:
+                            yield entry.stat(follow_symlinks=False).st_size
+
+            total_size = sum(_walk_sizes(dirpath))
             
-            logger.debug(f"Directory size calculated: {dirpath} = {total_size} bytes")
+            logger.debug("Directory size calculated: %s = %s bytes", dirpath, total_size)
             return total_size
         except Exception as e:
-            logger.error(f"Error calculating directory size {dirpath}: {e}")
+            logger.error("Error calculating directory size %s: %s", dirpath, e)
             return None
     
     @staticmethod
@@ -222,10 +242,15 @@ class DirectoryOperations:
         try:
             dirpath = Path(dirpath)
             if not dirpath.exists() or not dirpath.is_dir():
-                logger.error(f"Invalid directory: {dirpath}")
+                logger.error("Invalid directory: %s", dirpath)
                 return None
             
-            return not any(dirpath.iterdir())
+            # The first entry answers the question; scandir stops after
+            # one getdents round-trip and allocates no Path objects
+            with os.scandir(dirpath) as it:
+                for _ in it:
+                    return False
+            return True
         except Exception as e:
-            logger.error(f"Error checking if directory is empty {dirpath}: {e}")
+            logger.error("Error checking if directory is empty %s: %s", dirpath, e)
             return None
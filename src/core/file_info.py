@@ -2,114 +2,208 @@ import os
 import stat
 import logging
 import mimetypes
+import mmap
 import platform
 import ctypes
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from  typing import Union, Optional, Dict, Any  
+from typing import Union, Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 mimetypes.init()
 
+# Below this size the mmap setup cost outweighs the comparison win
+_MMAP_COMPARE_THRESHOLD = 1 << 20
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# rwx strings for all 512 combinations of the low nine mode bits,
+# built once at import so rendering permissions is a single index
+_PERM_STRINGS = [
+    ''.join('rwxrwxrwx'[i] if (m >> (8 - i)) & 1 else '-' for i in range(9))
+    for m in range(512)
+]
+
+
+@lru_cache(maxsize=2048)
+def _mime_for_suffix(suffix: str) -> str:
+    """MIME type for a lowercased suffix; cached since the type only
+    depends on the extension, not the full path"""
+    return (mimetypes.types_map.get(suffix)
+            or mimetypes.guess_type("x" + suffix)[0]
+            or "application/octet-stream")
+
 
 class FileInfos:
 
     @staticmethod
     def get_file_info(filepath: Union[str, Path]) -> Optional[Dict]:
         
-        path = Path(filepath)
+        # Stay on plain strings: the C-implemented os.path functions
+        # cover everything needed here without building a Path per call
+        path = os.fspath(filepath)
 
-        if not path.exists():
+        try:
+            # One lstat for everything: type checks become bit tests on
+            # st_mode instead of an extra stat/lstat syscall per
+            # is_dir/is_file/is_symlink call
+            path_stat = os.lstat(path)
+        except OSError:
             logger.error("Path doesn't exist: %s", path)
             return None
 
         try:
-            path_stat = path.stat()
-
-            info = {
-                "name": path.name,
-                "path": str(path.absolute()),
-                "parent": str(path.parent),
-                "type": "Directory" if path.is_dir() else "File",
-                "size_bytes": path_stat.st_size,
-                "size_human": FileInfos._human_readable_size(path_stat.st_size),
-                "created": datetime.fromtimestamp(path_stat.st_ctime).isoformat(),
-                "modified": datetime.fromtimestamp(path_stat.st_mtime).isoformat(),
-                "accessed": datetime.fromtimestamp(path_stat.st_atime).isoformat(),
-                "permissions": FileInfos._get_permissions(path_stat.st_mode),
-                "owner": path_stat.st_uid,
-                "group": path_stat.st_gid,
-                "inode": path_stat.st_ino,
-                "device": path_stat.st_dev,
-            }
-            
-            if path.is_file():
-                info.update({
-                    "lines": FileInfos._count_lines(path),
-                    "extension": path.suffix,
-                    "mime_type": FileInfos._get_file_type(path),
-                    "is_hidden": FileInfos.is_hidden(path)
-                })
-            elif path.is_dir():
-                items = list(path.iterdir())
-                info.update({
-                    "item_count": len(items),
-                    "is_empty": len(items) == 0,
-                    "is_hidden": FileInfos.is_hidden(path)
-                })
-
-            # Symlink Information
-            if path.is_symlink():
-                info.update({
-                    "type": "Symbolic Link",
-                    "target": str(path.resolve()),
-                    "is_broken": not path.exists(),
-                })
-
-            logger.debug("File info retrieved: %s", path)
-            return info
-        
+            is_link = stat.S_ISLNK(path_stat.st_mode)
+            is_broken = False
+            if is_link:
+                # Follow the link once so size/times describe the target,
+                # as stat() did before
+                try:
+                    path_stat = os.stat(path)
+                except OSError:
+                    is_broken = True
+
+            return FileInfos._info_from_stat(path, path_stat, is_link, is_broken)
+
         except OSError as e:
                 logger.error("Error getting infos: %s", path)
                 return None
-        
+
+    @staticmethod
+    def get_file_info_entry(entry: os.DirEntry) -> Optional[Dict]:
+        """
+        Get file info from an os.scandir DirEntry
+
+        The DirEntry memoises its type flags and stat_result, so callers
+        walking a directory get the same dict as get_file_info without
+        re-statting each child.
+
+        Args:
+            entry: DirEntry yielded by os.scandir
+
+        Returns:
+            Same dictionary as get_file_info, None if error
+        """
+        try:
+            is_link = entry.is_symlink()
+            is_broken = False
+            try:
+                entry_stat = entry.stat()
+            except OSError:
+                if not is_link:
+                    raise
+                # Broken link: report the link's own metadata
+                is_broken = True
+                entry_stat = entry.stat(follow_symlinks=False)
+
+            return FileInfos._info_from_stat(entry.path, entry_stat,
+                                             is_link, is_broken)
+
+        except OSError as e:
+            logger.error("Error getting infos: %s", entry.path)
+            return None
+
+    @staticmethod
+    def _info_from_stat(path: str, path_stat: os.stat_result,
+                        is_link: bool, is_broken: bool) -> Dict:
+        """Assemble the info dict from an already-fetched stat_result"""
+        mode = path_stat.st_mode
+        is_dir = stat.S_ISDIR(mode)
+        is_file = stat.S_ISREG(mode)
+
+        name = os.path.basename(path)
+        info = {
+            "name": name,
+            "path": os.path.abspath(path),
+            "parent": os.path.dirname(path) or ".",
+            "type": "Directory" if is_dir else "File",
+            "size_bytes": path_stat.st_size,
+            "size_human": FileInfos._human_readable_size(path_stat.st_size),
+            "created": datetime.fromtimestamp(path_stat.st_ctime).isoformat(),
+            "modified": datetime.fromtimestamp(path_stat.st_mtime).isoformat(),
+            "accessed": datetime.fromtimestamp(path_stat.st_atime).isoformat(),
+            "permissions": FileInfos._get_permissions(mode),
+            "owner": path_stat.st_uid,
+            "group": path_stat.st_gid,
+            "inode": path_stat.st_ino,
+            "device": path_stat.st_dev,
+        }
+
+        if is_file:
+            suffix = os.path.splitext(name)[1]
+            info.update({
+                "lines": FileInfos._count_lines(path),
+                "extension": suffix,
+                "mime_type": _mime_for_suffix(suffix.lower()),
+                "is_hidden": FileInfos.is_hidden(path)
+            })
+        elif is_dir:
+            # Count entries with scandir instead of materialising a
+            # list of Path objects
+            item_count = 0
+            with os.scandir(path) as it:
+                for _ in it:
+                    item_count += 1
+            info.update({
+                "item_count": item_count,
+                "is_empty": item_count == 0,
+                "is_hidden": FileInfos.is_hidden(path)
+            })
+
+        # Symlink Information
+        if is_link:
+            info.update({
+                "type": "Symbolic Link",
+                "target": os.path.realpath(path),
+                "is_broken": is_broken,
+            })
+
+        logger.debug("File info retrieved: %s", path)
+        return info
+
     @staticmethod
     def _human_readable_size(size_bytes: int) -> str:
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
+        # The unit index falls straight out of the bit length (each unit
+        # is 10 bits), so this is one integer op and a shift instead of
+        # up to five float divisions
+        if size_bytes <= 0:
+            return "0.00 B"
+        i = min((size_bytes.bit_length() - 1) // 10, 5)
+        return f"{size_bytes / (1 << (i * 10)):.2f} {_SIZE_UNITS[i]}"
     
     @staticmethod
     def _get_permissions(mode: int) -> str:
-        perm_map = [
-            (stat.S_IRUSR, 'r'), (stat.S_IWUSR, 'w'), (stat.S_IXUSR, 'x'),
-            (stat.S_IRGRP, 'r'), (stat.S_IWGRP, 'w'), (stat.S_IXGRP, 'x'),
-            (stat.S_IROTH, 'r'), (stat.S_IWOTH, 'w'), (stat.S_IXOTH, 'x')
-        ]
-
         if stat.S_ISDIR(mode): type_char = "d"
         elif stat.S_ISLNK(mode): type_char = "l"
         else: type_char = "-"
 
-        perms = [char if mode & bit else "-" for bit, char in perm_map]
-        return type_char + "".join(perms)
+        return type_char + _PERM_STRINGS[mode & 0o777]
     
     @staticmethod
-    def _count_lines(p: Path) -> int:
-
+    def _count_lines(p: Union[str, Path]) -> int:
+        # Count newlines over 1 MiB binary blocks: bytes.count is a
+        # C-level scan, with no per-line object creation and no UTF-8
+        # decode. Binary mode also works on non-text files, so the old
+        # text/binary fallback pair collapses into one loop.
         try:
-            with p.open("r", encoding='utf-8', errors='ignore') as f:
-                return sum(1 for _ in f)
+            with open(p, "rb") as f:
+                read = f.read
+                count = 0
+                last = b"\n"
+                while True:
+                    chunk = read(1 << 20)
+                    if not chunk:
+                        break
+                    count += chunk.count(b"\n")
+                    last = chunk[-1:]
+                if last != b"\n":
+                    count += 1  # final line without a trailing newline
+                return count
         except Exception as e:
-            try:
-                # Fallback for binary files
-                with p.open("rb") as f:
-                    return sum(1 for _ in f)
-            except Exception as e2:
-                logger.error("Error counting lines in %s: %s", p, e2)
-                return None
+            logger.error("Error counting lines in %s: %s", p, e)
+            return None
             
     @staticmethod
     def _get_file_type(filepath: Union[str, Path]) -> Optional[str]:
@@ -123,10 +217,9 @@ class FileInfos:
             elif filepath.is_symlink():
                 return "Symbolic Link"
             
-            mime_type, _ = mimetypes.guess_type(str(filepath))
-            return mime_type or "application/octet-stream"
+            return _mime_for_suffix(filepath.suffix.lower())
         except Exception as e:
-            logger.error(f"Error getting MIME type for {filepath}: {e}")
+            logger.error("Error getting MIME type for %s: %s", filepath, e)
             return None
 
     @staticmethod
@@ -162,6 +255,12 @@ class FileInfos:
         # Buffered content check
         try:
             with p1.open('rb') as f1, p2.open('rb') as f2:
+                if size1 >= _MMAP_COMPARE_THRESHOLD:
+                    try:
+                        return FileInfos._compare_mmap(f1, f2, size1)
+                    except (OSError, ValueError):
+                        pass  # not mappable, fall back to the read loop
+
                 while True:
                     chunk1, chunk2 = f1.read(8192), f2.read(8192)
                     if chunk1 != chunk2:
@@ -170,6 +269,23 @@ class FileInfos:
                         return {"content_equal": True}
         except Exception as e:
             return {"error": str(e)}
+
+    @staticmethod
+    def _compare_mmap(f1, f2, size: int) -> Dict[str, Any]:
+        """Compare two equal-sized open files via mmap in 1 MiB slices
+
+        The slice comparison dispatches to a C-level memcmp over
+        page-cache-mapped memory instead of allocating bytes objects
+        per chunk in a Python loop.
+        """
+        step = 1 << 20
+        with mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ) as m1, \
+                mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ) as m2, \
+                memoryview(m1) as v1, memoryview(m2) as v2:
+            for i in range(0, size, step):
+                if v1[i:i + step] != v2[i:i + step]:
+                    return {"content_equal": False, "reason": "Content mismatch"}
+        return {"content_equal": True}
         
 
     @staticmethod
@@ -179,32 +295,42 @@ class FileInfos:
             directory = Path(directory)
             if not directory.is_dir():
                 return None
-            
-            def build_tree(path: Path, depth: int = 0):
-                if depth > max_depth:
-                    return None
-                
-                tree = {
-                    "name": path.name,
-                    "path": str(path),
-                    "type": "directory" if path.is_dir() else "file",
-                    "size": path.stat().st_size if path.is_file() else 0,
-                }
-                
-                if path.is_dir():
-                    tree["children"] = []
-                    try:
-                        for child in path.iterdir():
-                            child_tree = build_tree(child, depth + 1)
-                            if child_tree:
-                                tree["children"].append(child_tree)
-                    except PermissionError:
-                        tree["permission_error"] = True
-                
-                return tree
-            
-            return build_tree(directory)
-            
+
+            root = {
+                "name": directory.name,
+                "path": str(directory),
+                "type": "directory",
+                "size": 0,
+                "children": [],
+            }
+
+            # Breadth-first scandir walk: DirEntry answers type and size
+            # from the directory read (no stat per node) and a deque
+            # replaces one Python recursion frame per directory
+            queue = deque([(root, str(directory), 0)])
+            while queue:
+                parent, path, depth = queue.popleft()
+                try:
+                    with os.scandir(path) as it:
+                        for entry in it:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                            node = {
+                                "name": entry.name,
+                                "path": entry.path,
+                                "type": "directory" if is_dir else "file",
+                                "size": 0 if is_dir
+                                        else entry.stat(follow_symlinks=False).st_size,
+                            }
+                            if is_dir:
+                                node["children"] = []
+                                if depth + 1 < max_depth:
+                                    queue.append((node, entry.path, depth + 1))
+                            parent["children"].append(node)
+                except PermissionError:
+                    parent["permission_error"] = True
+
+            return root
+
         except Exception as e:
-            logger.error(f"Error building directory tree for {directory}: {e}")
+            logger.error("Error building directory tree for %s: %s", directory, e)
             return None
\ No newline at end of file
@@ -6,11 +6,118 @@ Handles basic CRUD operations for files
 import os
 import shutil
 import logging
+import mmap
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# Below this size the mmap setup cost outweighs the copy it saves
+_MMAP_READ_THRESHOLD = 1 << 16
+
+
+class _ChunkIterator:
+    """Iterator over fixed-size chunks of an open raw descriptor
+
+    A plain slotted class instead of a generator closure: no suspended
+    frame or closure cells held between chunks, and __length_hint__
+    lets list() preallocate when the chunks are materialised.
+    """
+    __slots__ = ('_fd', '_chunk_size', '_remaining')
+
+    def __init__(self, fd: int, chunk_size: int, size: int):
+        self._fd = fd
+        self._chunk_size = chunk_size
+        self._remaining = size
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> bytes:
+        if self._fd is None:
+            raise StopIteration
+        chunk = os.read(self._fd, self._chunk_size)
+        if not chunk:
+            self.close()
+            raise StopIteration
+        self._remaining -= len(chunk)
+        return chunk
+
+    def __length_hint__(self) -> int:
+        if self._fd is None:
+            return 0
+        return max(0, -(-self._remaining // self._chunk_size))
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self):
+        self.close()
+
+
+def _read_small(filepath: str, size: int,
+                _open=os.open, _read=os.read, _close=os.close,
+                _flag=os.O_RDONLY) -> bytes:
+    """Fused open/read/close for files below the mmap threshold
+
+    One function frame covering the whole read, with the os calls
+    pre-bound as defaults so each is a single fast-local load -- the
+    closest pure-Python gets to the C-extension read_small that was
+    floated for this path. Asking for one byte past the stat size means
+    the common case is exactly three syscalls, while a file that grew
+    since the stat just keeps reading.
+    """
+    fd = _open(filepath, _flag)
+    try:
+        chunks = []
+        want = size + 1
+        while True:
+            chunk = _read(fd, want)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        _close(fd)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+def _fast_copy(source, destination):
+    """Copy file data kernel-side where possible
+
+    os.copy_file_range never brings the data into user space and is a
+    cheap CoW clone on reflink-capable filesystems. Kernels or
+    filesystem pairs that refuse it drop to os.sendfile, which still
+    keeps the bytes kernel-side but accepts cross-device descriptors,
+    and only then to buffered 1 MiB copies. The fd offsets advance on
+    partial success, so each fallback resumes where the previous tier
+    stopped. Metadata is carried over as shutil.copy2 would.
+    """
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(),
+                                            remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except (AttributeError, OSError):
+            try:
+                while remaining > 0:
+                    sent = os.sendfile(dst.fileno(), src.fileno(),
+                                       None, remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+            except (AttributeError, OSError):
+                shutil.copyfileobj(src, dst, 1 << 20)
+    shutil.copystat(source, destination)
+    return destination
+
 
 class FileOperations:
     """Handles basic file CRUD operations"""
@@ -28,17 +135,38 @@ class FileOperations:
             True if successful, False otherwise
         """
         try:
-            filepath = Path(filepath)
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            logger.info(f"File created: {filepath}")
+            FileOperations._create_fast(os.fspath(filepath), content)
+            logger.info("File created: %s", filepath)
             return True
         except Exception as e:
-            logger.error(f"Error creating file {filepath}: {e}")
+            logger.error("Error creating file %s: %s", filepath, e)
             return False
+
+    @staticmethod
+    def _create_fast(filepath: str, content: str):
+        """Creation fast path: no try blocks of its own, so the common
+        case runs straight through while create_file handles the error
+        translation around it"""
+        # The C-implemented os.path routines cover everything needed
+        # here without constructing a Path per call
+        parent = os.path.dirname(filepath)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+
+        # Single-shot write on the raw fd: skips the text encoder and
+        # BufferedWriter layers, and fadvise(DONTNEED) hints the
+        # kernel that a write-once file need not pollute the cache
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if content:
+                data = content.encode('utf-8')
+                written = 0
+                while written < len(data):
+                    written += os.write(fd, data[written:])
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
     
     @staticmethod
     def read_file(filepath: Union[str, Path], binary: bool = False) -> Optional[Union[str, bytes]]:
@@ -53,23 +181,247 @@ class FileOperations:
             File contents as string or bytes, None if error
         """
         try:
-            filepath = Path(filepath)
-            if not filepath.exists():
-                logger.error(f"File not found: {filepath}")
+            filepath = os.fspath(filepath)
+            try:
+                # One stat serves both the existence check and the size
+                # threshold; no separate exists() round trip
+                size = os.stat(filepath).st_size
+            except FileNotFoundError:
+                logger.error("File not found: %s", filepath)
                 return None
-            
-            mode = 'rb' if binary else 'r'
-            encoding = None if binary else 'utf-8'
-            
-            with open(filepath, mode, encoding=encoding) as f:
-                content = f.read()
-            
-            logger.debug(f"File read: {filepath}")
+
+            if size >= _MMAP_READ_THRESHOLD:
+                try:
+                    content = FileOperations._read_mmap(filepath, binary)
+                    logger.debug("File read: %s", filepath)
+                    return content
+                except (OSError, ValueError):
+                    pass  # not mappable, use the buffered path
+            else:
+                # Small files are dominated by per-call overhead, not
+                # data movement: the fused open/read/close helper is
+                # three syscalls with no file object in between
+                data = _read_small(filepath, size)
+                content = data if binary else data.decode('utf-8')
+                logger.debug("File read: %s", filepath)
+                return content
+
+            # Preallocate the exact size up front: readinto fills the
+            # buffer in place, with none of the growth reallocations
+            # and copies of f.read()'s internal doubling strategy.
+            # buffering=0 skips BufferedReader entirely, so each read
+            # lands in our buffer instead of being staged through an
+            # intermediate 8 KiB one (the loop absorbs short reads).
+            with open(filepath, 'rb', buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                buf = bytearray(size)
+                with memoryview(buf) as view:
+                    filled = 0
+                    while filled < size:
+                        n = f.readinto(view[filled:])
+                        if not n:
+                            break
+                        filled += n
+            data = bytes(buf[:filled])
+
+            # Text content decodes in one pass over the whole buffer --
+            # CPython's UTF-8 decoder has an ASCII fast path that beats
+            # TextIOWrapper's incremental decoding
+            content = data if binary else data.decode('utf-8')
+
+            logger.debug("File read: %s", filepath)
             return content
         except Exception as e:
-            logger.error(f"Error reading file {filepath}: {e}")
+            logger.error("Error reading file %s: %s", filepath, e)
             return None
     
+    @staticmethod
+    def read_lines(filepath: Union[str, Path],
+                binary: bool = False) -> Optional[Union[List[str], List[bytes]]]:
+        """
+        Read file contents as a list of lines
+
+        Reads the whole file once and splits with one C-level
+        splitlines pass instead of readlines()' per-line iteration.
+
+        Args:
+            filepath: Path to file to read
+            binary: If True, return bytes lines
+
+        Returns:
+            List of lines with line endings kept, None if error
+        """
+        content = FileOperations.read_file(filepath, binary=binary)
+        if content is None:
+            return None
+        return content.splitlines(keepends=True)
+
+    @staticmethod
+    def batch_read(filepaths: List[Union[str, Path]],
+                binary: bool = False) -> List[Optional[Union[str, bytes]]]:
+        """
+        Read several files concurrently
+
+        Small-file reads are dominated by per-call syscall latency;
+        a thread pool overlaps that latency since the interpreter
+        releases the GIL around the I/O.
+
+        Args:
+            filepaths: Paths of the files to read
+            binary: If True, return bytes contents
+
+        Returns:
+            File contents in input order, None entries for failed reads
+        """
+        if len(filepaths) <= 1:
+            return [FileOperations.read_file(p, binary=binary)
+                    for p in filepaths]
+
+        with ThreadPoolExecutor(max_workers=min(32, len(filepaths))) as pool:
+            return list(pool.map(
+                lambda p: FileOperations.read_file(p, binary=binary),
+                filepaths))
+
+    @staticmethod
+    def read_chunks(filepath: Union[str, Path], chunk_size: int = 1 << 20):
+        """
+        Iterate over a file's contents in large binary chunks
+
+        Reads straight from the raw descriptor with os.read, so a 1 GiB
+        file costs about a thousand syscalls at the default chunk size
+        instead of the ~131000 an 8 KiB buffered loop would issue.
+
+        Args:
+            filepath: Path to file to read
+            chunk_size: Bytes per chunk (default 1 MiB)
+
+        Returns:
+            Iterator of bytes chunks until end of file; the descriptor
+            closes at exhaustion, on close(), or when collected
+        """
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+        except OSError:
+            os.close(fd)
+            raise
+        return _ChunkIterator(fd, chunk_size, size)
+
+    @staticmethod
+    def read(filepath: Union[str, Path], mode: str = 'full',
+             binary: bool = False, chunk_size: int = 1 << 20):
+        """
+        Mode-based entry point over the specialized readers
+
+        Each mode's body lives in its own method (read_file,
+        read_lines, read_chunks) so the hot paths stay branch-free;
+        this dispatcher is one dict probe for callers that carry the
+        mode as data.
+
+        Args:
+            filepath: Path to file to read
+            mode: 'full', 'lines' or 'chunk'
+            binary: If True, return bytes ('full' and 'lines' modes)
+            chunk_size: Bytes per chunk ('chunk' mode only)
+
+        Returns:
+            Whatever the specialized reader returns, None for an
+            unknown mode
+        """
+        try:
+            reader = _READ_DISPATCH[mode]
+        except KeyError:
+            logger.error("Unknown read mode %r for %s", mode, filepath)
+            return None
+        return reader(filepath, binary, chunk_size)
+
+    @staticmethod
+    def read_into(filepath: Union[str, Path], buf,
+                  offset: int = 0) -> Optional[int]:
+        """
+        Read file contents into a caller-supplied buffer
+
+        Fills buf in place with a single positioned read (os.preadv),
+        so callers reusing one buffer across many files allocate
+        nothing per call -- read_file builds a fresh bytes object
+        every time.
+
+        Args:
+            filepath: Path to file to read
+            buf: Writable bytes-like object (bytearray, or a
+                memoryview over one) to fill; at most len(buf)
+                bytes are read
+            offset: Byte offset in the file to read from
+
+        Returns:
+            Number of bytes read (0 at end of file), None if error
+        """
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+            try:
+                return os.preadv(fd, [buf], offset)
+            finally:
+                os.close(fd)
+        except Exception as e:
+            logger.error("Error reading file %s: %s", filepath, e)
+            return None
+
+    @staticmethod
+    def _read_mmap(filepath: Union[str, Path], binary: bool) -> Union[str, bytes]:
+        """Read a large file through one read-only mapping
+
+        A single page-table setup plus demand paging replaces the
+        buffered read loop's repeated kernel-to-user copies, and text
+        content is decoded once over the whole buffer.
+        """
+        with open(filepath, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            data = mm[:]
+        return data if binary else data.decode('utf-8')
+
+    @staticmethod
+    def stream_to(source: Union[str, Path], dst_fd: int) -> Optional[int]:
+        """
+        Stream a file's contents to an already-open file descriptor
+
+        Uses os.sendfile where available, so the data is forwarded
+        inside the kernel without passing through user-space buffers.
+
+        Args:
+            source: Source file path
+            dst_fd: Writable file descriptor to forward the contents to
+
+        Returns:
+            Number of bytes forwarded, None if error
+        """
+        try:
+            with open(source, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                sent = 0
+                try:
+                    while sent < size:
+                        n = os.sendfile(dst_fd, f.fileno(), sent, size - sent)
+                        if n == 0:
+                            break
+                        sent += n
+                except (AttributeError, OSError):
+                    # sendfile unavailable or the descriptor rejects it:
+                    # fall back to a buffered user-space copy
+                    f.seek(sent)
+                    while True:
+                        chunk = f.read(1 << 20)
+                        if not chunk:
+                            break
+                        sent += os.write(dst_fd, chunk)
+
+            logger.debug("File streamed: %s (%s bytes)", source, sent)
+            return sent
+        except Exception as e:
+            logger.error("Error streaming file %s: %s", source, e)
+            return None
+
     @staticmethod
     def update_file(filepath: Union[str, Path], content: str, append: bool = False) -> bool:
         """
@@ -85,19 +437,23 @@ class FileOperations:
         """
         try:
             filepath = Path(filepath)
-            if not filepath.exists():
-                logger.error(f"File not found: {filepath}")
+            # Opening without O_CREAT keeps the must-exist semantics in
+            # the open itself -- no separate exists() stat beforehand
+            flags = os.O_WRONLY | (os.O_APPEND if append else os.O_TRUNC)
+            try:
+                fd = os.open(filepath, flags)
+            except FileNotFoundError:
+                logger.error("File not found: %s", filepath)
                 return False
-            
-            mode = 'a' if append else 'w'
-            with open(filepath, mode, encoding='utf-8') as f:
+
+            with open(fd, 'w', encoding='utf-8') as f:
                 f.write(content)
-            
+
             action = "appended to" if append else "updated"
-            logger.info(f"File {action}: {filepath}")
+            logger.info("File %s: %s", action, filepath)
             return True
         except Exception as e:
-            logger.error(f"Error updating file {filepath}: {e}")
+            logger.error("Error updating file %s: %s", filepath, e)
             return False
     
     @staticmethod
@@ -113,19 +469,22 @@ class FileOperations:
         """
         try:
             filepath = Path(filepath)
-            if not filepath.exists():
-                logger.error(f"File not found: {filepath}")
+            # One lstat answers both existence and the directory check
+            try:
+                mode = os.lstat(filepath).st_mode
+            except FileNotFoundError:
+                logger.error("File not found: %s", filepath)
                 return False
-            
-            if filepath.is_dir():
-                logger.error(f"Cannot delete directory with delete_file: {filepath}")
+
+            if stat.S_ISDIR(mode):
+                logger.error("Cannot delete directory with delete_file: %s", filepath)
                 return False
-            
+
             filepath.unlink()
-            logger.info(f"File deleted: {filepath}")
+            logger.info("File deleted: %s", filepath)
             return True
         except Exception as e:
-            logger.error(f"Error deleting file {filepath}: {e}")
+            logger.error("Error deleting file %s: %s", filepath, e)
             return False
     
     @staticmethod
@@ -143,18 +502,19 @@ class FileOperations:
         try:
             source = Path(source)
             destination = Path(destination)
-            
-            if not source.exists():
-                logger.error(f"Source file not found: {source}")
+
+            # faccessat is a lighter syscall than the stat behind exists()
+            if not os.access(source, os.F_OK):
+                logger.error("Source file not found: %s", source)
                 return False
-            
+
             destination.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, destination)
-            
-            logger.info(f"File copied: {source} -> {destination}")
+            _fast_copy(source, destination)
+
+            logger.info("File copied: %s -> %s", source, destination)
             return True
         except Exception as e:
-            logger.error(f"Error copying file {source} to {destination}: {e}")
+            logger.error("Error copying file %s to %s: %s", source, destination, e)
             return False
     
     @staticmethod
@@ -172,18 +532,24 @@ class FileOperations:
         try:
             source = Path(source)
             destination = Path(destination)
-            
-            if not source.exists():
-                logger.error(f"Source file not found: {source}")
+
+            if not os.access(source, os.F_OK):
+                logger.error("Source file not found: %s", source)
                 return False
-            
+
             destination.parent.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(source), str(destination))
-            
-            logger.info(f"File moved: {source} -> {destination}")
+            try:
+                # Same-filesystem move is a single renameat syscall
+                os.rename(source, destination)
+            except OSError:
+                # Cross-device (EXDEV) moves and moves into an existing
+                # directory need shutil.move's copy/relocate fallback
+                shutil.move(str(source), str(destination))
+
+            logger.info("File moved: %s -> %s", source, destination)
             return True
         except Exception as e:
-            logger.error(f"Error moving file {source} to {destination}: {e}")
+            logger.error("Error moving file %s to %s: %s", source, destination, e)
             return False
     
     @staticmethod
@@ -200,15 +566,25 @@ class FileOperations:
         """
         try:
             filepath = Path(filepath)
-            if not filepath.exists():
-                logger.error(f"File not found: {filepath}")
+            if not os.access(filepath, os.F_OK):
+                logger.error("File not found: %s", filepath)
                 return False
-            
+
             new_path = filepath.parent / new_name
             filepath.rename(new_path)
-            
-            logger.info(f"File renamed: {filepath} -> {new_path}")
+
+            logger.info("File renamed: %s -> %s", filepath, new_path)
             return True
         except Exception as e:
-            logger.error(f"Error renaming file {filepath}: {e}")
+            logger.error("Error renaming file %s: %s", filepath, e)
             return False
+
+
+# Mode name -> specialized reader, built once so read() resolves its
+# concrete code path with a single dict probe; the adapters normalise
+# the differing signatures
+_READ_DISPATCH = {
+    'full': lambda p, binary, chunk_size: FileOperations.read_file(p, binary=binary),
+    'lines': lambda p, binary, chunk_size: FileOperations.read_lines(p, binary=binary),
+    'chunk': lambda p, binary, chunk_size: FileOperations.read_chunks(p, chunk_size),
+}
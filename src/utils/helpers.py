@@ -10,6 +10,11 @@ from datetime import datetime
 import json
 import shutil
 
+# Resolved once at import: every default path below hangs off the
+# project root, so there is no need to rebuild and re-resolve the
+# Path chain on each call
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
 def setup_logging(log_level: str="INFO", log_file: str=None):
     """ 
     Setup Logging configurations
@@ -20,7 +25,7 @@ def setup_logging(log_level: str="INFO", log_file: str=None):
     """
 
     # Create logs directory if it does not exists
-    log_dir = Path(__file__).parent.parent.parent / "logs"
+    log_dir = _PROJECT_ROOT / "logs"
     log_dir.mkdir(exist_ok=True)
 
     # Timestamp to default logs file
@@ -49,7 +54,7 @@ def load_config(config_path: Path=None) -> Dict[str, Any]:
         Configuration Dictionary """
     
     if config_path is None:
-        config_path = Path(__file__).parent.parent.parent / "config" / "settings.json"
+        config_path = _PROJECT_ROOT / "config" / "settings.json"
 
     try:
         if config_path.exists():
@@ -66,7 +71,7 @@ def load_config(config_path: Path=None) -> Dict[str, Any]:
             }
         
     except Exception as e:
-        logging.error(f"Error loading configuration: {e}")
+        logging.error("Error loading configuration: %s", e)
         return {}
     
 
@@ -80,15 +85,15 @@ def save_config(config: Dict[str, Any], config_path: Path=None) -> bool:
     """
 
     if config_path is None:
-        config_path = Path(__file__).parent.parent.parent / "config" / "config.json"
+        config_path = _PROJECT_ROOT / "config" / "config.json"
     try:
         config_path.mkdir(parents=True, exist_ok=True)
         with open(config_path, "w") as f:
             json.dump(config_path, f, indent=4)
-        logging.info(f"Configuration saved to {config_path}")
+        logging.info("Configuration saved to %s", config_path)
         return True
     except Exception as e:
-        logging.error(f"Error saving configuration: {e}")
+        logging.error("Error saving configuration: %s", e)
         return False
     
 def format_size(size_bytes: int) -> str:
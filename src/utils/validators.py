@@ -91,7 +91,7 @@ class Validators:
             valid_extensions = [extension if extension.startwith(".") else f".{extension}" for extension in valid_extensions]
 
             if ext.lower() not in [extension.lower() for extension in valid_extensions]:
-                logger.error(f"Invalid extension: {ext}")
+                logger.error("Invalid extension: %s", ext)
                 return False
             
         return True
@@ -114,11 +114,11 @@ class Validators:
             return False
         
         if min_size is not None and size < min_size:
-            logger.error(f"Size {size} is below minimum {min_size}")
+            logger.error("Size %s is below minimum %s", size, min_size)
             return False
         
         if max_size is not None and size > max_size:
-            logger.error(f"Size {size} exceeds maximum {max_size}")
+            logger.error("Size %s exceeds maximum %s", size, max_size)
             return False
         
         return True
@@ -160,7 +160,7 @@ class Validators:
             re.compile(pattern)
             return True
         except re.error as e:
-            logger.error(f"Invalid regex pattern: {e}")
+            logger.error("Invalid regex pattern: %s", e)
             return False
         
     @staticmethod
@@ -199,7 +199,7 @@ class Validators:
         valid_formats = ['zip', 'tar', 'tar.gz', 'tar.bz2', 'tar.xz']
         
         if format_str.lower() not in valid_formats:
-            logger.error(f"Invalid archive format: {format_str}")
+            logger.error("Invalid archive format: %s", format_str)
             return False
         
         return True
@@ -218,7 +218,7 @@ class Validators:
         valid_algorithms = ['md5', 'sha1', 'sha256', 'sha512']
         
         if algorithm.lower() not in valid_algorithms:
-            logger.error(f"Invalid hash algorithm: {algorithm}")
+            logger.error("Invalid hash algorithm: %s", algorithm)
             return False
         
         return True
\ No newline at end of file